@@ -9,6 +9,7 @@ from ..common import Stream
 
 
 __all__ = (
+    "Buffer",
     "MessageFields",
     "MessageFieldType",
     "MessageType",
@@ -18,6 +19,7 @@ __all__ = (
     "WireType",
 
     "decode_message",
+    "encode_varint",
     "get_wire_type",
     "read_bytes",
     "read_message",
@@ -25,6 +27,7 @@ __all__ = (
     "read_primitive",
     "read_string",
     "read_varint",
+    "read_varints",
     "write",
     "write_bytes",
     "write_message",
@@ -56,13 +59,16 @@ class WireType(Enum):
 
     @classmethod
     def of(cls, value: int) -> WireType:
-        for member in cls:
-            if member.value == value:
-                return member
+        try:
+            return _WIRE_TYPE_BY_VALUE[value]
+        except KeyError:
+            raise ValueError
+
 
-        raise ValueError
+_WIRE_TYPE_BY_VALUE = {member.value: member for member in WireType}
 
 
+type Buffer = bytes | memoryview
 type Type = PrimitiveType | MessageType
 type MessageFieldType = Type | OptionalType[typing.Any, typing.Any]
 
@@ -77,66 +83,142 @@ class OptionalType[A: Type, B]:
 
 
 type MessageFields = dict[int, tuple[str, MessageFieldType]]
+type MessageEncoder = typing.Callable[[Stream, dict[str, typing.Any]], None]
+type MessageDecoder = typing.Callable[[Buffer], dict[str, typing.Any]]
+
+_UNDEFINED = object()
 
 
 class MessageType:
     fields: MessageFields
+    _encode: MessageEncoder
+    _decode: MessageDecoder
 
     def __init__(self, fields: MessageFields) -> None:
         self.fields = fields
+        self._encode = _compile_encoder(fields)
+        self._decode = _compile_decoder(fields)
+
+
+_PRIMITIVE_WIRE_TYPES = {
+    PrimitiveType.INT32: WireType.VARINT,
+    PrimitiveType.STRING: WireType.LEN,
+    PrimitiveType.UINT32: WireType.VARINT
+}
 
 
 def get_wire_type(type: Type) -> WireType:
+    wire_type = _PRIMITIVE_WIRE_TYPES.get(type)
+
+    if wire_type is not None:
+        return wire_type
+
     if isinstance(type, MessageType):
         return WireType.LEN
-    elif type == PrimitiveType.INT32:
-        return WireType.VARINT
-    elif type == PrimitiveType.STRING:
-        return WireType.LEN
 
     raise NotImplementedError
 
 
-def read_varint(stream: Stream) -> int:
-    value = 0
-    shift = 0
+def read_varint(data: Buffer, offset: int = 0) -> tuple[int, int]:
+    try:
+        payload = data[offset]
+    except IndexError:
+        raise EOFError
 
-    while True:
-        buf = stream.read(1)
+    offset += 1
 
-        if not buf:
+    if not payload & 0x80:
+        return payload, offset
+
+    value = payload & 0x7F
+    shift = 0x07
+
+    while True:
+        try:
+            payload = data[offset]
+        except IndexError:
             raise EOFError
 
-        payload = buf[0]
+        offset += 1
         value |= (payload & 0x7F) << shift
         shift += 0x07
-        flag = payload & 0x80
 
-        if not flag:
+        if not payload & 0x80:
             break
 
-    return value
+    return value, offset
+
+
+def read_varints(
+    data: Buffer,
+    offset: int,
+    count: int
+) -> tuple[list[int], int]:
+    values = []
+    append = values.append
+
+    for _ in range(count):
+        try:
+            payload = data[offset]
+        except IndexError:
+            raise EOFError
+
+        offset += 1
+
+        if not payload & 0x80:
+            append(payload)
+            continue
 
+        value = payload & 0x7F
+        shift = 0x07
 
-def read_bytes(stream: Stream) -> bytes:
-    size = read_varint(stream)
-    value = stream.read(size)
+        while True:
+            try:
+                payload = data[offset]
+            except IndexError:
+                raise EOFError
 
-    if len(value) != size:
+            offset += 1
+            value |= (payload & 0x7F) << shift
+            shift += 0x07
+
+            if not payload & 0x80:
+                break
+
+        append(value)
+
+    return values, offset
+
+
+def read_bytes(data: Buffer, offset: int) -> tuple[bytes, int]:
+    size, offset = read_varint(data, offset)
+    end = offset + size
+
+    if end > len(data):
         raise EOFError
 
-    return value
+    return bytes(data[offset:end]), end
 
 
-def read_string(stream: Stream, encoding: str = "utf-8") -> str:
-    return read_bytes(stream).decode(encoding)
+def read_string(
+    data: Buffer,
+    offset: int,
+    encoding: str = "utf-8"
+) -> tuple[str, int]:
+    value, offset = read_bytes(data, offset)
+
+    if encoding == "utf-8":
+        return value.decode(), offset
+
+    return value.decode(encoding), offset
 
 
 def read_message_field(
-    stream: Stream,
+    data: Buffer,
+    offset: int,
     fields: MessageFields
-) -> tuple[int, typing.Any]:
-    tag = read_varint(stream)
+) -> tuple[int, typing.Any, int]:
+    tag, offset = read_varint(data, offset)
     field_number = tag >> 0x03
 
     try:
@@ -148,58 +230,149 @@ def read_message_field(
         field_type = field_type.type
 
     if isinstance(field_type, MessageType):
-        size = read_varint(stream)
+        size, offset = read_varint(data, offset)
+        end = offset + size
+
+        if end > len(data):
+            raise EOFError
+
+        return field_number, read_message(data[offset:end], field_type), end
+
+    field_value, offset = read_primitive(data, offset, field_type)
+
+    return field_number, field_value, offset
+
+
+def _compile_decoder(fields: MessageFields) -> MessageDecoder:
+    namespace = {
+        "UnexpectedFieldNumberError": UnexpectedFieldNumberError,
+        "read_string": read_string,
+        "read_varint": read_varint
+    }
+
+    lines = [
+        "def _decode(data):",
+        "    size = len(data)",
+        "    offset = 0",
+        "    message = {}",
+        "    while offset < size:",
+        "        tag, offset = read_varint(data, offset)"
+    ]
+
+    branch = "if"
+
+    for index, (field_number, (field_name, field_type)) in enumerate(
+        fields.items()
+    ):
+        if isinstance(field_type, OptionalType):
+            field_type = field_type.type
+
+        wire_type = get_wire_type(field_type)
+        tag = (field_number << 0x03) | wire_type.value
+
+        lines.append(f"        {branch} tag == {tag}:")
+
+        if isinstance(field_type, MessageType):
+            namespace[f"_type_{index}"] = field_type
 
-        return field_number, read_message(stream, field_type, size)
+            lines.append(
+                "            field_size, offset = read_varint(data, offset)"
+            )
+
+            lines.append("            end = offset + field_size")
+            lines.append("            if end > size:")
+            lines.append("                raise EOFError")
+
+            lines.append(
+                f"            message[{field_name!r}] = "
+                f"_type_{index}._decode(data[offset:end])"
+            )
+
+            lines.append("            offset = end")
+        elif field_type == PrimitiveType.STRING:
+            lines.append(
+                f"            message[{field_name!r}], offset = "
+                "read_string(data, offset)"
+            )
+        else:
+            lines.append(
+                f"            message[{field_name!r}], offset = "
+                "read_varint(data, offset)"
+            )
+
+        branch = "elif"
+
+    if branch == "elif":
+        lines.append("        else:")
+        lines.append("            raise UnexpectedFieldNumberError")
     else:
-        return field_number, read_primitive(stream, field_type)
+        lines.append("        raise UnexpectedFieldNumberError")
 
+    lines.append("    return message")
 
-def read_message(
-    stream: Stream,
-    type: MessageType,
-    size: int
-) -> dict[str, typing.Any]:
-    fields = type.fields
-    data = stream.read(size)
+    exec("\n".join(lines), namespace)
 
-    if len(data) != size:
-        raise EOFError
+    return namespace["_decode"]
 
-    substream = BytesIO(data)
-    message = {}
 
-    while True:
-        try:
-            field_number, field_value = read_message_field(substream, fields)
-        except EOFError:
-            break
+def read_message(data: Buffer, type: MessageType) -> dict[str, typing.Any]:
+    return type._decode(data)
 
-        field_name, _ = fields[field_number]
-        message[field_name] = field_value
 
-    return message
+_PRIMITIVE_READERS = {
+    PrimitiveType.INT32: read_varint,
+    PrimitiveType.STRING: read_string,
+    PrimitiveType.UINT32: read_varint
+}
 
 
 def read_primitive(
-    stream: Stream,
+    data: Buffer,
+    offset: int,
     type: PrimitiveType
-) -> typing.Any:
-    if type == PrimitiveType.INT32:
-        return read_varint(stream)
-    elif type == PrimitiveType.STRING:
-        return read_string(stream)
-    elif type == PrimitiveType.UINT32:
-        return read_varint(stream)
+) -> tuple[typing.Any, int]:
+    try:
+        reader = _PRIMITIVE_READERS[type]
+    except KeyError:
+        raise NotImplementedError
 
-    raise NotImplementedError
+    return reader(data, offset)
 
 
 def decode_message(data: bytes, type: MessageType) -> dict[str, typing.Any]:
-    return read_message(BytesIO(data), type, len(data))
+    return read_message(memoryview(data), type)
+
+
+def encode_varint(value: int) -> bytes:
+    if value < 0x80:
+        return bytes((value,))
+    elif value < 0x4000:
+        return bytes((
+            (value & 0x7F) | 0x80,
+            value >> 0x07
+        ))
+    elif value < 0x200000:
+        return bytes((
+            (value & 0x7F) | 0x80,
+            ((value >> 0x07) & 0x7F) | 0x80,
+            value >> 0x0E
+        ))
+    elif value < 0x10000000:
+        return bytes((
+            (value & 0x7F) | 0x80,
+            ((value >> 0x07) & 0x7F) | 0x80,
+            ((value >> 0x0E) & 0x7F) | 0x80,
+            value >> 0x15
+        ))
+    elif value < 0x800000000:
+        return bytes((
+            (value & 0x7F) | 0x80,
+            ((value >> 0x07) & 0x7F) | 0x80,
+            ((value >> 0x0E) & 0x7F) | 0x80,
+            ((value >> 0x15) & 0x7F) | 0x80,
+            value >> 0x1C
+        ))
 
-
-def write_varint(stream: Stream, value: int) -> None:
     buf = bytearray()
 
     while value >= 0x80:
@@ -207,16 +380,23 @@ def write_varint(stream: Stream, value: int) -> None:
         value >>= 0x07
 
     buf.append(value)
-    stream.write(buf)
+
+    return bytes(buf)
+
+
+def write_varint(stream: Stream, value: int) -> None:
+    stream.write(encode_varint(value))
 
 
 def write_bytes(stream: Stream, value: bytes) -> None:
-    write_varint(stream, len(value))
-    stream.write(value)
+    stream.write(encode_varint(len(value)) + value)
 
 
 def write_string(stream: Stream, value: str, encoding: str = "utf-8") -> None:
-    write_bytes(stream, value.encode(encoding))
+    if encoding == "utf-8":
+        write_bytes(stream, value.encode())
+    else:
+        write_bytes(stream, value.encode(encoding))
 
 
 def write_message_field(
@@ -235,7 +415,73 @@ def write_message_field(
     tag = (field_number << 0x03) | wire_type.value
 
     write_varint(stream, tag)
-    write(stream, field_type, value)
+
+    if isinstance(field_type, MessageType):
+        buf = BytesIO()
+        write_message(buf, field_type, value)
+        write_bytes(stream, buf.getvalue())
+    else:
+        write(stream, field_type, value)
+
+
+def _compile_encoder(fields: MessageFields) -> MessageEncoder:
+    namespace = {
+        "BytesIO": BytesIO,
+        "encode_varint": encode_varint
+    }
+
+    lines = ["def _encode(stream, value):"]
+
+    if not fields:
+        lines.append("    pass")
+
+    for index, (field_number, (field_name, field_type)) in enumerate(
+        fields.items()
+    ):
+        field_default = _UNDEFINED
+
+        if isinstance(field_type, OptionalType):
+            field_default = field_type.value
+            field_type = field_type.type
+
+        wire_type = get_wire_type(field_type)
+        tag = encode_varint((field_number << 0x03) | wire_type.value)
+        indent = "    "
+
+        lines.append(f"{indent}field_value = value[{field_name!r}]")
+
+        if field_default is not _UNDEFINED:
+            namespace[f"_default_{index}"] = field_default
+            lines.append(f"{indent}if field_value != _default_{index}:")
+            indent += "    "
+
+        if isinstance(field_type, MessageType):
+            namespace[f"_type_{index}"] = field_type
+            lines.append(f"{indent}buf = BytesIO()")
+            lines.append(f"{indent}_type_{index}._encode(buf, field_value)")
+            lines.append(f"{indent}field_data = buf.getvalue()")
+
+            lines.append(
+                f"{indent}stream.write("
+                f"{tag!r} + encode_varint(len(field_data)) + field_data)"
+            )
+        elif field_type == PrimitiveType.STRING:
+            lines.append(
+                f"{indent}field_data = field_value.encode(\"utf-8\")"
+            )
+
+            lines.append(
+                f"{indent}stream.write("
+                f"{tag!r} + encode_varint(len(field_data)) + field_data)"
+            )
+        else:
+            lines.append(
+                f"{indent}stream.write({tag!r} + encode_varint(field_value))"
+            )
+
+    exec("\n".join(lines), namespace)
+
+    return namespace["_encode"]
 
 
 def write_message(
@@ -243,19 +489,23 @@ def write_message(
     message_type: MessageType,
     value: dict[str, typing.Any]
 ) -> None:
-    for field_number, (field_name, field_type) in message_type.fields.items():
-        field_value = value[field_name]
-        write_message_field(stream, field_type, field_number, field_value)
+    message_type._encode(stream, value)
+
+
+_PRIMITIVE_WRITERS = {
+    PrimitiveType.INT32: write_varint,
+    PrimitiveType.STRING: write_string,
+    PrimitiveType.UINT32: write_varint
+}
 
 
 def write(stream: Stream, type: Type, value: typing.Any) -> None:
-    if type == PrimitiveType.INT32:
-        return write_varint(stream, value)
-    elif type == PrimitiveType.STRING:
-        return write_string(stream, value)
-    elif type == PrimitiveType.UINT32:
-        return write_varint(stream, value)
-    elif isinstance(type, MessageType):
+    writer = _PRIMITIVE_WRITERS.get(type)
+
+    if writer is not None:
+        return writer(stream, value)
+
+    if isinstance(type, MessageType):
         return write_message(stream, type, value)
 
     raise NotImplementedError
@@ -1,3 +1,4 @@
+import functools
 import typing
 
 from typing import Annotated, Any, TypeAliasType
@@ -54,6 +55,7 @@ type uint32 = Annotated[
 ]
 
 
+@functools.lru_cache(maxsize=None)
 def get_field_number(target: Any) -> int:
     if isinstance(target, TypeAliasType):
         return get_field_number(target.__value__)
@@ -75,6 +77,7 @@ def get_field_number(target: Any) -> int:
     return get_field_number(type_args[0])
 
 
+@functools.lru_cache(maxsize=None)
 def get_model_type(model: type[BaseModel]) -> codec.MessageType:
     fields = {}
 
@@ -97,6 +100,7 @@ def get_model_type(model: type[BaseModel]) -> codec.MessageType:
     return codec.MessageType(fields)
 
 
+@functools.lru_cache(maxsize=None)
 def get_type(target: Any) -> codec.Type:
     if isinstance(target, TypeAliasType):
         return get_type(target.__value__)
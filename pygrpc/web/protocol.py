@@ -1,15 +1,25 @@
 from __future__ import annotations
 
 import base64
+import binascii
+import functools
+import re
+import struct
+import threading
 
 from enum import Enum, auto
 from io import BytesIO
-from typing import Generator
+from typing import Any, Generator
 
 import aiohttp
 
 from pydantic import BaseModel, TypeAdapter
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 from .. import protobuf
 
 
@@ -29,6 +39,7 @@ __all__ = (
     "write_message_frame",
     "write_trailer_frame",
     "read_frame",
+    "read_unary_response_data",
     "unary_unary_call"
 )
 
@@ -55,32 +66,85 @@ class FrameId(Enum):
 
     @classmethod
     def of(cls, value: bytes) -> FrameId:
-        for member in cls:
-            if member.value == value:
-                return member
+        try:
+            return _FRAME_ID_BY_VALUE[value]
+        except KeyError:
+            raise UnknownFrameIdError
+
 
-        raise UnknownFrameIdError
+_FRAME_ID_BY_VALUE = {member.value: member for member in FrameId}
 
 
 type Headers = dict[str, str]
 type Trailers = dict[str, str]
 
 
+_FRAME_HEADER = struct.Struct(">cI")
+
+_TRAILER_PATTERN = re.compile(rb"([^:\r\n]+):([^\r\n]*)\r\n")
+
+_CHUNK_SIZE = 0x4000
+
+_local = threading.local()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_type_adapter(model: Any) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_model_converter(model: Any) -> Any:
+    if (
+        msgspec is not None
+        and isinstance(model, type)
+        and issubclass(model, msgspec.Struct)
+    ):
+        def convert(message):
+            return msgspec.convert(message, type=model)
+
+        return convert
+
+    return _get_type_adapter(model).validate_python
+
+
+def _scratch_buffer() -> BytesIO:
+    buf = getattr(_local, "buffer", None)
+
+    if buf is None:
+        buf = _local.buffer = BytesIO()
+
+    buf.seek(0)
+    buf.truncate()
+
+    return buf
+
+
 def write_frame(stream: Stream, id: FrameId, data: bytes) -> None:
-    stream.write(id.value)
-    stream.write(len(data).to_bytes(length=4, byteorder="big", signed=False))
+    stream.write(_FRAME_HEADER.pack(id.value, len(data)))
     stream.write(data)
 
 
+def _patch_frame_header(stream: Stream, id: FrameId, start: int) -> None:
+    end = stream.tell()
+    size = end - start - _FRAME_HEADER.size
+
+    stream.seek(start)
+    stream.write(_FRAME_HEADER.pack(id.value, size))
+    stream.seek(end)
+
+
 def write_message_frame(
     stream: Stream,
     type: protobuf.MessageType,
     message: BaseModel
 ) -> None:
-    buf = BytesIO()
-    protobuf.write_message(buf, type, message.model_dump())
-    data = buf.getvalue()
-    write_frame(stream, FrameId.MESSAGE, data)
+    start = stream.tell()
+
+    stream.write(_FRAME_HEADER.pack(FrameId.MESSAGE.value, 0))
+    protobuf.write_message(stream, type, message.model_dump())
+
+    _patch_frame_header(stream, FrameId.MESSAGE, start)
 
 
 def write_trailer_frame(
@@ -88,30 +152,24 @@ def write_trailer_frame(
     trailers: Trailers,
     encoding: str = "utf-8"
 ) -> None:
-    buf = BytesIO()
+    start = stream.tell()
 
-    for k, v in trailers.items():
-        buf.write(f"{k}: {v}\r\n".encode(encoding))
+    stream.write(_FRAME_HEADER.pack(FrameId.TRAILER.value, 0))
 
-    data = buf.getvalue()
+    for k, v in trailers.items():
+        stream.write(f"{k}: {v}\r\n".encode(encoding))
 
-    write_frame(stream, FrameId.TRAILER, data)
+    _patch_frame_header(stream, FrameId.TRAILER, start)
 
 
 def read_frame(stream: Stream) -> tuple[FrameId, bytes]:
-    data = stream.read(1)
+    header = stream.read(_FRAME_HEADER.size)
 
-    if not data:
+    if len(header) != _FRAME_HEADER.size:
         raise EOFError
 
-    frame_id = FrameId.of(data)
-
-    data = stream.read(4)
-
-    if len(data) != 4:
-        raise EOFError
-
-    size = int.from_bytes(data, byteorder="big", signed=False)
+    frame_id, size = _FRAME_HEADER.unpack(header)
+    frame_id = FrameId.of(frame_id)
     data = stream.read(size)
 
     if len(data) != size:
@@ -121,33 +179,43 @@ def read_frame(stream: Stream) -> tuple[FrameId, bytes]:
 
 
 def decode_frames(data: bytes) -> Generator[tuple[FrameId, bytes]]:
-    buf = BytesIO(data)
+    view = memoryview(data)
+    size = len(view)
+    offset = 0
 
-    while buf.tell() != len(data):
-        yield read_frame(buf)
+    while offset < size:
+        end = offset + _FRAME_HEADER.size
 
+        if end > size:
+            raise EOFError
 
-def decode_trailers(data: bytes, encoding: str = "utf-8") -> Trailers:
-    text = data.decode(encoding)
-    lines = text.split("\r\n")
-    trailers = {}
+        frame_id, frame_size = _FRAME_HEADER.unpack_from(view, offset)
+        frame_id = FrameId.of(frame_id)
+        offset = end + frame_size
+
+        if offset > size:
+            raise EOFError
 
-    for line in lines[:-1]:
-        key, value = line.split(":", maxsplit=1)
-        key = key.strip()
-        value = value.strip()
+        yield frame_id, bytes(view[end:offset])
 
-        trailers[key] = value
 
-    return trailers
+def decode_trailers(data: bytes, encoding: str = "utf-8") -> Trailers:
+    return {
+        key.decode(encoding).strip(): value.decode(encoding).strip()
+        for key, value in _TRAILER_PATTERN.findall(data)
+    }
 
 
 def decode_unary_response(
     data: bytes,
     type: protobuf.MessageType,
-    model: Any
+    model: Any,
+    text_mode: bool = False
 ) -> tuple[BaseModel, Trailers]:
-    frames = list(decode_frames(base64.b64decode(data)))
+    if text_mode:
+        data = base64.b64decode(data)
+
+    frames = list(decode_frames(data))
 
     if len(frames) == 0:
         raise FrameExpectedError
@@ -157,7 +225,7 @@ def decode_unary_response(
         if frame_id != FrameId.MESSAGE:
             raise FrameExpectedError
 
-        message = TypeAdapter(model).validate_python(
+        message = _get_model_converter(model)(
             protobuf.decode_message(
                 frame_data,
                 type
@@ -174,7 +242,7 @@ def decode_unary_response(
 
             raise UnexpectedFrameError
         
-        message = TypeAdapter(model).validate_python(
+        message = _get_model_converter(model)(
             protobuf.decode_message(
                 message_frame_data,
                 type
@@ -191,19 +259,89 @@ def decode_unary_response(
 def encode_unary_request(
     type: protobuf.MessageType,
     message: BaseModel,
-    trailers: Trailers
+    trailers: Trailers,
+    text_mode: bool = False
 ) -> bytes:
-    buf = BytesIO()
+    buf = _scratch_buffer()
 
     write_message_frame(buf, type, message)
 
     if trailers:
         write_trailer_frame(buf, trailers)
 
-    data = buf.getvalue()
-    data = base64.b64encode(data)
+    if text_mode:
+        return base64.b64encode(buf.getbuffer())
+
+    return bytes(buf.getbuffer())
+
+
+def _decode_base64_segments(pending: bytearray, data: bytearray) -> None:
+    while True:
+        index = pending.find(0x3D)
+
+        if index < 0:
+            aligned = len(pending) & ~0x03
+        else:
+            end = ((index >> 0x02) + 1) << 0x02
+
+            if end <= len(pending):
+                data.extend(binascii.a2b_base64(bytes(pending[:end])))
+                del pending[:end]
+
+                continue
+
+            aligned = index & ~0x03
+
+        if aligned:
+            data.extend(binascii.a2b_base64(bytes(pending[:aligned])))
+            del pending[:aligned]
+
+        return
+
+
+async def read_unary_response_data(
+    content: aiohttp.StreamReader,
+    text_mode: bool = False
+) -> bytes:
+    data = bytearray()
+
+    if not text_mode:
+        async for chunk in content.iter_chunked(_CHUNK_SIZE):
+            data.extend(chunk)
+
+        return bytes(data)
+
+    pending = bytearray()
 
-    return data
+    async for chunk in content.iter_chunked(_CHUNK_SIZE):
+        pending.extend(chunk)
+        _decode_base64_segments(pending, data)
+
+    if pending:
+        data.extend(binascii.a2b_base64(bytes(pending)))
+
+    return bytes(data)
+
+
+async def _post_unary_request(
+    session: aiohttp.ClientSession,
+    url: str,
+    data: bytes,
+    headers: Headers,
+    content_type: str
+) -> tuple[str, bytes]:
+    async with session.post(url, data=data, headers=headers) as response:
+        response_content_type = response.headers.get(
+            "Content-Type",
+            content_type
+        )
+
+        response_data = await read_unary_response_data(
+            response.content,
+            "-text" in response_content_type
+        )
+
+    return response_content_type, response_data
 
 
 async def unary_unary_call(
@@ -213,29 +351,46 @@ async def unary_unary_call(
     request_headers: Headers,
     request_trailers: Trailers,
     response_type: protobuf.MessageType,
-    response_model: Any
+    response_model: Any,
+    text_mode: bool = False,
+    session: aiohttp.ClientSession | None = None
 ) -> tuple[BaseModel, Trailers]:
+    content_type = (
+        "application/grpc-web-text" if text_mode
+        else "application/grpc-web+proto"
+    )
+
     request_headers = {
         **request_headers,
-        "Accept": "application/grpc-web-text",
-        "Content-Type": "application/grpc-web-text",
+        "Accept": content_type,
+        "Content-Type": content_type,
         "X-User-Agent": "grpc-web-javascript/0.1"
     }
 
     request_data = encode_unary_request(
         request_type,
         request_message,
-        request_trailers
+        request_trailers,
+        text_mode
     )
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            _, response_data = await _post_unary_request(
+                session,
+                url,
+                request_data,
+                request_headers,
+                content_type
+            )
+    else:
+        _, response_data = await _post_unary_request(
+            session,
             url,
-            data=request_data,
-            headers=request_headers
-        ) as response:
-
-            response_data = await response.read()
+            request_data,
+            request_headers,
+            content_type
+        )
 
     response_message, response_trailers = decode_unary_response(
         response_data,
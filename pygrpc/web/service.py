@@ -1,5 +1,8 @@
+import asyncio
 import inspect
 
+import aiohttp
+
 from pydantic import BaseModel
 from yarl import URL
 
@@ -72,7 +75,8 @@ def generate_method(template):
             headers,
             trailers,
             response_type,
-            response_annotation
+            response_annotation,
+            session=self._get_session()
         )
 
     return run
@@ -89,6 +93,39 @@ def service(name=None):
                 self.url = url
                 self.headers = headers
                 self.trailers = trailers
+                self._session = None
+                self._session_loop = None
+
+            def _get_session(self):
+                loop = asyncio.get_running_loop()
+                session = self._session
+
+                if (
+                    session is None
+                    or session.closed
+                    or self._session_loop is not loop
+                ):
+                    session = aiohttp.ClientSession(
+                        connector=aiohttp.TCPConnector(ttl_dns_cache=300)
+                    )
+
+                    self._session = session
+                    self._session_loop = loop
+
+                return session
+
+            async def aclose(self):
+                session = self._session
+                loop = self._session_loop
+                self._session = None
+                self._session_loop = None
+
+                if (
+                    session is not None
+                    and not session.closed
+                    and loop is asyncio.get_running_loop()
+                ):
+                    await session.close()
 
         templates = inspect.getmembers(
             Service,